@@ -1,87 +1,157 @@
 """
 Pytest configuration file for the High School Management System tests.
 This file contains fixtures for setting up the live server for JavaScript tests.
+The live server itself lives in live_test_server.py.
 """
 
 import os
+import json
+import datetime
 import pytest
-import threading
-import time
-import uvicorn
-import socket
-from contextlib import closing
+from bs4 import BeautifulSoup
 from app import app
-from selenium import webdriver
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from webdriver_manager.firefox import GeckoDriverManager
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-
-def find_free_port():
-    """Find a free port to run the test server."""
-    with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
-        s.bind(('', 0))
-        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        return s.getsockname()[1]
-
-class LiveServer:
-    def __init__(self, app, port):
-        self.app = app
-        self.port = port
-        self.url = f"http://localhost:{port}"
-        self.server_thread = None
-        self.ready = threading.Event()
-
-    def start(self):
-        """Start the live server in a separate thread."""
-        self.server_thread = threading.Thread(
-            target=self._run_server,
-            daemon=True
-        )
-        self.server_thread.start()
-        
-        # Wait for server to start
-        retry = 0
-        while retry < 5:
-            try:
-                with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
-                    s.connect(('localhost', self.port))
-                    self.ready.set()
-                    return
-            except socket.error:
-                time.sleep(0.1)
-                retry += 1
-    
-    def stop(self):
-        """Signal the server to stop."""
-        # The server will stop when the thread is killed
-        pass
-        
-    def _run_server(self):
-        """Run the server using Uvicorn."""
-        uvicorn.run(app, host="0.0.0.0", port=self.port, log_level="error")
+from static_files import read_static
+
+# Uvicorn, requests and Selenium are imported inside the fixtures that need them,
+# so tests that only use TestClient never load the browser or server stack.
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "selenium: test drives a real browser (deselect with '-m \"not selenium\"')"
+    )
+    config.addinivalue_line(
+        "markers", "serial: test must not run in parallel with other serial tests under pytest-xdist"
+    )
 
-@pytest.fixture(scope="function")
+# Run before pytest-xdist reads the xdist_group markers
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Mark every test that uses the selenium fixture, so browser tests can be skipped with -m.
+    Serial tests are put in one xdist group so `--dist loadgroup` runs them on a single worker.
+    """
+    for item in items:
+        if "selenium" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.selenium)
+        if item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.xdist_group("serial"))
+
+@pytest.fixture(scope="session")
+def index_soup():
+    """index.html parsed once per test session with the lxml parser."""
+    return BeautifulSoup(read_static("index.html"), "lxml")
+
+@pytest.fixture(scope="session")
 def live_server():
-    """Provide a live server for testing with Selenium."""
-    port = find_free_port()
-    server = LiveServer(app, port)
-    server.start()
+    """
+    Provide a live server for testing with Selenium.
+    The server is started once and shared by every test in the session,
+    or by every test on the same worker when running under pytest-xdist.
+    """
+    from live_test_server import LiveServer, bind_server_socket, live_server_port
     
-    # Wait for the server to be ready
-    if not server.ready.wait(timeout=5):
-        raise Exception("Server failed to start within timeout")
+    server = LiveServer(app, bind_server_socket(live_server_port()))
+    server.start()
     
     try:
+        # Wait for the server to be ready
+        if not server.ready.wait(timeout=5):
+            raise Exception("Server failed to start within timeout")
+        
         yield server
     finally:
         server.stop()
 
-@pytest.fixture
-def selenium(request):
+@pytest.fixture(scope="session")
+def http_session():
+    """
+    Provide a requests Session for calling the live server directly.
+    Sharing one Session keeps connections alive across requests and tests.
+    """
+    import requests
+    
+    with requests.Session() as session:
+        yield session
+
+# Path to the GeckoDriver binary, resolved at most once per test session
+_geckodriver_path = None
+
+GECKODRIVER_NAMES = ("geckodriver", "geckodriver.exe")
+
+def is_geckodriver_binary(path):
+    """Check that a cached path is a runnable GeckoDriver binary, not e.g. the downloaded archive."""
+    return (
+        os.path.basename(path) in GECKODRIVER_NAMES
+        and os.path.isfile(path)
+        and os.access(path, os.X_OK)
+    )
+
+def wdm_cache_roots():
+    """
+    Cache directories webdriver-manager may have used.
+    Under pytest-xdist it caches per worker in ~/.wdm/<worker>, so check that first.
+    """
+    root = os.path.expanduser("~/.wdm")
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker:
+        return [os.path.join(root, worker), root]
+    return [root]
+
+def find_cached_geckodriver():
+    """
+    Find a GeckoDriver binary that is already on disk, without using the network.
+    GECKODRIVER_PATH takes precedence over the webdriver-manager cache.
+    """
+    env_path = os.environ.get("GECKODRIVER_PATH")
+    if env_path:
+        # An explicitly pinned driver may have any name, but must be runnable
+        if not (os.path.isfile(env_path) and os.access(env_path, os.X_OK)):
+            pytest.fail(f"GECKODRIVER_PATH is set to {env_path!r}, which is not an executable file")
+        return env_path
+    
+    # webdriver-manager records each driver it installs in drivers.json
+    for root in wdm_cache_roots():
+        try:
+            with open(os.path.join(root, "drivers.json"), "r") as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            continue
+        
+        candidates = []
+        for key, info in metadata.items():
+            path = info.get("binary_path", "")
+            if "_geckodriver_" not in key or not is_geckodriver_binary(path):
+                continue
+            try:
+                timestamp = datetime.datetime.strptime(info.get("timestamp", ""), "%d/%m/%Y")
+            except ValueError:
+                timestamp = datetime.datetime.min
+            candidates.append((timestamp, path))
+        if candidates:
+            return max(candidates)[1]
+    return None
+
+def get_geckodriver_path():
+    """Install GeckoDriver on first use and reuse its path afterwards."""
+    global _geckodriver_path
+    if _geckodriver_path is None:
+        from webdriver_manager.firefox import GeckoDriverManager
+        
+        # Only ask webdriver-manager (which checks versions online) on a cache miss
+        _geckodriver_path = find_cached_geckodriver() or GeckoDriverManager().install()
+    return _geckodriver_path
+
+@pytest.fixture(scope="session")
+def selenium(request, tmp_path_factory):
     """
     Create and configure a Selenium WebDriver instance using Firefox.
     This fixture is specifically configured for GitHub Codespaces environment.
+    A single browser is shared by every test in the session.
     """
+    from selenium import webdriver
+    from selenium.webdriver.firefox.service import Service as FirefoxService
+    from selenium.webdriver.firefox.options import Options as FirefoxOptions
+    
     # Configure Firefox options for headless environment
     options = FirefoxOptions()
     options.add_argument("--headless")
@@ -90,22 +160,46 @@ def selenium(request):
     options.add_argument("--width=1920")
     options.add_argument("--height=1080")
     
-    driver = None
+    # Run Firefox directly in one profile directory for the whole session. Passing it with
+    # -profile (rather than options.profile, which copies and zips it) lets the cache persist.
+    options.add_argument("-profile")
+    options.add_argument(str(tmp_path_factory.mktemp("ff-profile", numbered=False)))
+    
+    # Skip work the test pages don't need
+    options.set_preference("permissions.default.image", 2)
+    options.set_preference("browser.cache.disk.enable", True)
+    options.set_preference("browser.sessionstore.resume_from_crash", False)
+    options.set_preference("browser.startup.homepage", "about:blank")
+    
     try:
         # Try to install and setup GeckoDriver
-        service = FirefoxService(GeckoDriverManager().install())
+        service = FirefoxService(get_geckodriver_path())
         driver = webdriver.Firefox(service=service, options=options)
-        
-        # Set an implicit wait to handle potential timing issues
-        driver.implicitly_wait(10)
-        
-        yield driver
-        
     except Exception as e:
         # If Firefox fails, try using a web testing library that doesn't require a browser
         pytest.skip(f"Skipping test because Firefox WebDriver couldn't be initialized: {str(e)}")
     
-    finally:
-        # Quit the driver after the test is complete (if it was created)
-        if driver:
-            driver.quit()
\ No newline at end of file
+    # Quit the driver once the whole session is complete
+    request.addfinalizer(driver.quit)
+    
+    yield driver
+
+@pytest.fixture
+def wait(selenium):
+    """
+    Provide an explicit wait for the session WebDriver.
+    Use wait.until(EC...) to wait for elements, and wait.until_not(...) for negative checks,
+    instead of relying on an implicit wait that delays every failing lookup.
+    """
+    from selenium.webdriver.support.ui import WebDriverWait
+    
+    return WebDriverWait(selenium, 5, poll_frequency=0.2)
+
+@pytest.fixture(autouse=True)
+def reset_browser(request):
+    """Clear browser state between tests that share the session WebDriver."""
+    if "selenium" in request.fixturenames:
+        driver = request.getfixturevalue("selenium")
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+    yield
@@ -0,0 +1,90 @@
+"""
+Live Uvicorn server used by the browser-based tests.
+This module is only imported by the live_server fixture, so tests that stay on
+TestClient never load Uvicorn or start a server thread.
+"""
+
+import os
+import socket
+import threading
+import uvicorn
+
+# Base port for the live server; each pytest-xdist worker uses its own offset from it.
+# Kept clear of 8000, where the app runs during development.
+LIVE_SERVER_BASE_PORT = 8100
+LIVE_SERVER_HOST = "127.0.0.1"
+
+def live_server_port():
+    """Pick a deterministic port for this pytest-xdist worker (gw0 when not using xdist)."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return LIVE_SERVER_BASE_PORT + int(worker.replace("gw", ""))
+
+def _listening_socket(port):
+    """Bind a loopback socket to the port and start listening on it."""
+    # Close-on-exec so the listening socket never leaks into child processes
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM | getattr(socket, "SOCK_CLOEXEC", 0))
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        # Loopback only: avoids dual-stack lookups and firewall prompts for all-interface binds
+        sock.bind((LIVE_SERVER_HOST, port))
+        # Listen right away: with SO_REUSEADDR a bind alone doesn't hold the port exclusively,
+        # so a conflict would otherwise only surface later, inside Uvicorn's thread
+        sock.listen()
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+def bind_server_socket(port):
+    """
+    Bind the socket the live server will listen on.
+    The listening socket is handed straight to Uvicorn, so nothing can grab the port in between.
+    """
+    try:
+        return _listening_socket(port)
+    except OSError:
+        # The worker's port is taken (e.g. by another pytest run), so let the OS pick a free one
+        return _listening_socket(0)
+
+class ReadyServer(uvicorn.Server):
+    """Uvicorn server that signals an event as soon as startup has completed."""
+
+    def __init__(self, config, ready):
+        super().__init__(config)
+        self.ready = ready
+
+    async def startup(self, sockets=None):
+        await super().startup(sockets=sockets)
+        if self.started:
+            self.ready.set()
+
+class LiveServer:
+    def __init__(self, app, sock):
+        self.app = app
+        self.socket = sock
+        self.port = sock.getsockname()[1]
+        self.url = f"http://{LIVE_SERVER_HOST}:{self.port}"
+        self.server_thread = None
+        self.ready = threading.Event()
+        config = uvicorn.Config(app, host=LIVE_SERVER_HOST, fd=sock.fileno(), log_level="error", lifespan="on",
+                                loop="uvloop", http="httptools")
+        self.server = ReadyServer(config, self.ready)
+
+    def start(self):
+        """Start the live server in a separate thread."""
+        self.server_thread = threading.Thread(
+            target=self._run_server,
+            daemon=True
+        )
+        self.server_thread.start()
+    
+    def stop(self):
+        """Signal the server to stop and wait for it to shut down."""
+        self.server.should_exit = True
+        if self.server_thread:
+            self.server_thread.join(timeout=5)
+        self.socket.close()
+        
+    def _run_server(self):
+        """Run the server using Uvicorn."""
+        self.server.run()
@@ -0,0 +1,14 @@
+"""
+Helpers for reading the High School Management System static files in tests.
+"""
+
+import functools
+import os
+
+STATIC_DIR = os.path.join(os.path.dirname(__file__), 'static')
+
+@functools.lru_cache(maxsize=4)
+def read_static(name):
+    """Read a file from the static directory, hitting the disk at most once per process."""
+    with open(os.path.join(STATIC_DIR, name), 'r') as f:
+        return f.read()
@@ -6,14 +6,27 @@ correctly, including checks with different email casing.
 
 from fastapi.testclient import TestClient
 import pytest
+import uuid
 from app import app
 
 client = TestClient(app)
 
+@pytest.fixture
+def activities_snapshot():
+    """
+    Fetch the activities once for a test, adding a set of lowercased participant
+    emails to each activity for case-insensitive membership checks.
+    """
+    data = client.get("/activities").json()
+    return {
+        name: {**details, "participants_lower": frozenset(p.lower() for p in details["participants"])}
+        for name, details in data.items()
+    }
+
 def test_signup_with_new_email():
     """Test that a new user can sign up for an activity successfully."""
     # This is a new email that doesn't exist in any activity
-    email = "newuser@mergington.edu"
+    email = f"newuser-{uuid.uuid4().hex}@mergington.edu"
     activity = "Chess Club"
     
     response = client.post(
@@ -43,16 +56,14 @@ def test_duplicate_signup_same_casing():
     assert response.status_code == 400
     assert "Already signed up for this activity" in response.json()["detail"]
 
-def test_duplicate_signup_different_casing():
+def test_duplicate_signup_different_casing(activities_snapshot):
     """Test that a user cannot sign up with the same email but different casing."""
     # First sign up with a lowercase email
-    new_email = "casetest@mergington.edu"
+    new_email = f"casetest-{uuid.uuid4().hex}@mergington.edu"
     activity = "Art Club"
     
-    # Ensure this user isn't already in the system (can remove this in a real test)
-    activities_response = client.get("/activities")
-    if new_email in [p.lower() for p in activities_response.json()[activity]["participants"]]:
-        pytest.skip("Test email already exists in system, skipping")
+    # The user must not be signed up in any casing before the first signup
+    assert new_email not in activities_snapshot[activity]["participants_lower"]
     
     # First signup should succeed
     response = client.post(
@@ -62,7 +73,7 @@ def test_duplicate_signup_different_casing():
     assert response.status_code == 200
     
     # Try to sign up again with the same email but uppercase
-    uppercase_email = "CASETEST@MERGINGTON.EDU"
+    uppercase_email = new_email.upper()
     response = client.post(
         f"/activities/{activity}/signup",
         params={"email": uppercase_email}
@@ -72,37 +83,34 @@ def test_duplicate_signup_different_casing():
     assert response.status_code == 400
     assert "Already signed up for this activity" in response.json()["detail"]
 
-def test_mixed_case_signup_validation():
-    """Test that a user cannot sign up with mixed case email variations."""
-    # First sign up with a mixed-case email
-    mixed_case_email = "MixedCase@Mergington.edu"
-    activity = "Math Club"
-    
-    # Ensure this user isn't already in the system
-    activities_response = client.get("/activities")
-    if mixed_case_email.lower() in [p.lower() for p in activities_response.json()[activity]["participants"]]:
-        pytest.skip("Test email already exists in system, skipping")
+MIXED_CASE_ACTIVITY = "Math Club"
+
+@pytest.fixture(scope="module")
+def mixed_case_signup():
+    """Sign up a mixed-case email once and share it across the casing variant tests."""
+    mixed_case_email = f"MixedCase-{uuid.uuid4().hex}@Mergington.edu"
     
     # First signup should succeed
     response = client.post(
-        f"/activities/{activity}/signup",
+        f"/activities/{MIXED_CASE_ACTIVITY}/signup",
         params={"email": mixed_case_email}
     )
     assert response.status_code == 200
+    return mixed_case_email
+
+@pytest.mark.parametrize("make_variant", [
+    str.lower,  # all lowercase
+    str.upper,  # all uppercase
+    str.capitalize,  # different mixed case
+], ids=["lowercase", "uppercase", "capitalized"])
+def test_mixed_case_signup_validation(mixed_case_signup, make_variant):
+    """Test that a user cannot sign up with mixed case email variations."""
+    variant = make_variant(mixed_case_signup)
+    response = client.post(
+        f"/activities/{MIXED_CASE_ACTIVITY}/signup",
+        params={"email": variant}
+    )
     
-    # Try different casing variations
-    variations = [
-        "mixedcase@mergington.edu",  # all lowercase
-        "MIXEDCASE@MERGINGTON.EDU",  # all uppercase
-        "Mixedcase@mergington.edu",  # different mixed case
-    ]
-    
-    for variant in variations:
-        response = client.post(
-            f"/activities/{activity}/signup",
-            params={"email": variant}
-        )
-        
-        # Should return a 400 error for duplicate signup
-        assert response.status_code == 400, f"Failed with email variant: {variant}"
-        assert "Already signed up for this activity" in response.json()["detail"]
\ No newline at end of file
+    # Should return a 400 error for duplicate signup
+    assert response.status_code == 400, f"Failed with email variant: {variant}"
+    assert "Already signed up for this activity" in response.json()["detail"]
\ No newline at end of file
@@ -7,47 +7,58 @@ and ensure that HTML content is escaped properly.
 import pytest
 import time
 import json
-import os
 from fastapi.testclient import TestClient
-from bs4 import BeautifulSoup
 from app import app
+from static_files import read_static
 import re
+import uuid
 
 client = TestClient(app)
 
+# Extracts the body of the escapeHTML function from app.js
+_ESCAPE_HTML_RE = re.compile(r'function\s+escapeHTML\s*\(.*?\)\s*\{([^}]+)\}', re.DOTALL)
+
+# HTML special characters and the entities escapeHTML should turn them into
+COMMON_ENTITIES = ["&", "<", ">", '"', "'"]
+ESCAPED_ENTITIES = ["&amp;", "&lt;", "&gt;", "&quot;", "&#039;"]
+
+# Matches any of the characters or entities above in a single pass, longest first
+_ENTITIES_RE = re.compile("|".join(
+    map(re.escape, sorted(COMMON_ENTITIES + ESCAPED_ENTITIES, key=len, reverse=True))
+))
+
+# Code patterns that indicate an empty participants list is handled
+NO_PARTICIPANTS_PATTERNS = [
+    "No participants", 
+    "participants.length === 0", 
+    "participants.length == 0",
+    "!participants.length"
+]
+_EMPTY_CHECK_RE = re.compile("|".join(map(re.escape, NO_PARTICIPANTS_PATTERNS)))
+
 def test_html_escaping_in_static_file():
     """Test that the escapeHTML function exists in app.js and properly escapes HTML."""
-    # Read the app.js file
-    with open(os.path.join(os.path.dirname(__file__), 'static', 'app.js'), 'r') as f:
-        js_content = f.read()
+    js_content = read_static("app.js")
     
     # Check if escapeHTML function exists
     assert 'function escapeHTML' in js_content, "escapeHTML function not found in app.js"
     
-    # Check if the function handles the common HTML entities
-    common_entities = ["&", "<", ">", '"', "'"]
-    escaped_entities = ["&amp;", "&lt;", "&gt;", "&quot;", "&#039;"]
+    # Check if the function handles the common HTML entities, scanning the source once
+    found = set(_ENTITIES_RE.findall(js_content))
+    # A raw "&" is also present wherever one of the escaped entities was matched
+    found_chars = {match[0] for match in found}
     
-    for entity, escaped in zip(common_entities, escaped_entities):
-        assert f"{entity}" in js_content and f"{escaped}" in js_content, f"Escaping for {entity} not found in app.js"
+    for entity, escaped in zip(COMMON_ENTITIES, ESCAPED_ENTITIES):
+        assert entity in found_chars and escaped in found, f"Escaping for {entity} not found in app.js"
 
-def test_participants_list_structure():
+def test_participants_list_structure(index_soup):
     """Test that the HTML structure in index.html supports participants lists with proper classes."""
-    # Read the index.html file
-    with open(os.path.join(os.path.dirname(__file__), 'static', 'index.html'), 'r') as f:
-        html_content = f.read()
-    
-    # Parse with BeautifulSoup
-    soup = BeautifulSoup(html_content, 'html.parser')
+    js_content = read_static("app.js")
     
     # Check for activities-list container where activity cards will be dynamically added
-    activities_container = soup.select('#activities-list')
+    activities_container = index_soup.select('#activities-list')
     assert len(activities_container) > 0, "No activities container found in index.html"
     
-    # Check if app.js contains code to create elements with these classes
-    with open(os.path.join(os.path.dirname(__file__), 'static', 'app.js'), 'r') as f:
-        js_content = f.read()
-    
     # Check for the creation of activity-card elements
     assert 'activity-card' in js_content, "No activity-card class creation found in app.js"
     
@@ -56,9 +67,7 @@ def test_participants_list_structure():
 
 def test_app_js_fetch_functionality():
     """Test that app.js contains code to fetch activities and participants."""
-    # Read the app.js file
-    with open(os.path.join(os.path.dirname(__file__), 'static', 'app.js'), 'r') as f:
-        js_content = f.read()
+    js_content = read_static("app.js")
     
     # Check for fetch API usage
     assert 'fetch(' in js_content, "No fetch API calls found in app.js"
@@ -70,7 +79,7 @@ def test_app_js_fetch_functionality():
 def test_html_escaping_integration():
     """Test integration between backend and frontend for HTML escaping."""
     # First, add a user with potentially dangerous HTML to an activity via the API
-    malicious_email = "<script>alert('XSS')</script>@example.com"
+    malicious_email = f"<script>alert('XSS')</script>-{uuid.uuid4().hex}@example.com"
     activity = "Math Club"
     
     # Add the malicious email to an activity
@@ -90,11 +99,10 @@ def test_html_escaping_integration():
     assert "<script>" in activities_json or "<script>".lower() in activities_json, "Test script tag not found in JSON output"
     
     # Read the escapeHTML function from app.js
-    with open(os.path.join(os.path.dirname(__file__), 'static', 'app.js'), 'r') as f:
-        js_content = f.read()
+    js_content = read_static("app.js")
     
     # Extract the escapeHTML function
-    escape_html_match = re.search(r'function\s+escapeHTML\s*\(.*?\)\s*\{([^}]+)\}', js_content, re.DOTALL)
+    escape_html_match = _ESCAPE_HTML_RE.search(js_content)
     assert escape_html_match, "Could not extract escapeHTML function"
     
     # Check if the function handles script tags
@@ -103,17 +111,7 @@ def test_html_escaping_integration():
 
 def test_empty_participants_handling():
     """Test that app.js handles empty participants lists correctly."""
-    # Read the app.js file
-    with open(os.path.join(os.path.dirname(__file__), 'static', 'app.js'), 'r') as f:
-        js_content = f.read()
+    js_content = read_static("app.js")
     
     # Check for empty participants list handling
-    no_participants_patterns = [
-        "No participants", 
-        "participants.length === 0", 
-        "participants.length == 0",
-        "!participants.length"
-    ]
-    
-    has_empty_check = any(pattern in js_content for pattern in no_participants_patterns)
-    assert has_empty_check, "No handling for empty participants list found in app.js"
\ No newline at end of file
+    assert _EMPTY_CHECK_RE.search(js_content), "No handling for empty participants list found in app.js"
\ No newline at end of file
@@ -0,0 +1,11 @@
+"""
+Tests for the live server used by the High School Management System browser tests.
+These tests talk to a real Uvicorn server over HTTP, unlike the TestClient tests.
+"""
+
+def test_get_activities_from_live_server(live_server, http_session):
+    """Test that the activities endpoint is served over HTTP by the live server."""
+    response = http_session.get(f"{live_server.url}/activities")
+    
+    assert response.status_code == 200
+    assert "michael@mergington.edu" in response.json()["Chess Club"]["participants"]